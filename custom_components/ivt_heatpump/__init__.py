@@ -1,10 +1,12 @@
 """IVT Heat Pump integration for Home Assistant."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import IVTApi
@@ -18,9 +20,10 @@ from .const import (
     GW_HARDWARE,
     GW_SERIAL,
     GW_MAC,
+    MANUFACTURER,
     SYS_TYPE,
 )
-from .coordinator import IVTDataCoordinator
+from .coordinator import IVTConfigCoordinator, IVTDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,36 +59,64 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         on_token_refresh=_on_token_refresh,
     )
 
-    coordinator = IVTDataCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    config_coordinator = IVTConfigCoordinator(hass, api)
+    coordinator = IVTDataCoordinator(hass, api, config_coordinator)
+    await asyncio.gather(
+        config_coordinator.async_config_entry_first_refresh(),
+        coordinator.async_config_entry_first_refresh(),
+    )
 
     # Enrich device info from first poll data
     device_id = entry.data[CONF_DEVICE_ID]
-    fw_version = coordinator.get_value(GW_FIRMWARE)
-    hw_version = coordinator.get_value(GW_HARDWARE)
-    serial = coordinator.get_value(GW_SERIAL)
-    mac_addr = coordinator.get_value(GW_MAC)
-    sys_type = coordinator.get_value(SYS_TYPE)
+    fw_version = config_coordinator.get_value(GW_FIRMWARE)
+    hw_version = config_coordinator.get_value(GW_HARDWARE)
+    serial = config_coordinator.get_value(GW_SERIAL)
+    mac_addr = config_coordinator.get_value(GW_MAC)
+    sys_type = config_coordinator.get_value(SYS_TYPE)
     model = f"K30 ({sys_type})" if sys_type and sys_type != "unknown" else "K30"
 
-    # Register device with enriched info
-    from homeassistant.helpers import device_registry as dr
+    # Register device with enriched info — only touch the registry if something changed
     dev_reg = dr.async_get(hass)
-    dev_reg.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, device_id)},
-        name="IVT Heat Pump",
-        manufacturer="Bosch / IVT",
-        model=model,
-        sw_version=fw_version,
-        hw_version=hw_version,
-        serial_number=serial or device_id,
-        connections={(dr.CONNECTION_NETWORK_MAC, mac_addr)} if mac_addr else set(),
+    connections = (
+        {(dr.CONNECTION_NETWORK_MAC, dr.format_mac(mac_addr))} if mac_addr else set()
     )
+    device_fields = {
+        "manufacturer": MANUFACTURER,
+        "model": model,
+        "sw_version": fw_version,
+        "hw_version": hw_version,
+        "serial_number": serial or device_id,
+    }
+    device = dev_reg.async_get_device(identifiers={(DOMAIN, device_id)})
+    if device is None or entry.entry_id not in device.config_entries:
+        dev_reg.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, device_id)},
+            name="IVT Heat Pump",
+            connections=connections,
+            **device_fields,
+        )
+    else:
+        changes = {
+            key: value
+            for key, value in device_fields.items()
+            if getattr(device, key) != value
+        }
+        if not connections <= device.connections:
+            changes["merge_connections"] = connections
+        if changes:
+            dev_reg.async_update_device(device.id, **changes)
+
+    # Shared by every entity of this entry (HA never mutates it). Only links
+    # entities to the device registered above; listing model/manufacturer here
+    # would overwrite the enriched values every time the platforms load.
+    device_info = {"identifiers": {(DOMAIN, device_id)}}
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "config_coordinator": config_coordinator,
+        "device_info": device_info,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -97,5 +128,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["coordinator"].async_shutdown()
+        await data["config_coordinator"].async_shutdown()
     return unload_ok
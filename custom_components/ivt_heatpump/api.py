@@ -5,15 +5,23 @@ Direct HTTP calls to the K30 API endpoints.
 """
 
 import asyncio
-import json
+import base64
+import contextlib
+import functools
+import hashlib
 import logging
+import time
+import urllib.parse
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 
 import aiohttp
+import orjson
 
 from .const import (
     CLIENT_ID,
     CODE_VERIFIER,
+    DEFAULT_CONCURRENCY,
     POINTT_BASE_URL,
     REDIRECT_URI,
     SCOPES,
@@ -22,6 +30,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every request; a short connect timeout fails fast on a dead link
+_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5, sock_read=25)
+
 
 class IVTApiError(Exception):
     """Base exception for API errors."""
@@ -44,6 +55,27 @@ class IVTApi:
         await api.put("/heatingCircuits/hc1/temporaryRoomSetpoint", 22.0)
     """
 
+    __slots__ = (
+        "_session",
+        "_device_id",
+        "_base_url",
+        "_access_token",
+        "_refresh_token",
+        "_token_expires_at",
+        "_token_expires_at_ts",
+        "_on_token_refresh",
+        "_refresh_lock",
+        "_refresh_task",
+        "_get_sem",
+        "_write_lock",
+        "_no_write_pending",
+        "_reads_in_flight",
+        "_reads_idle",
+        "_auth_headers",
+        "_put_headers",
+        "_etag_cache",
+    )
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -52,6 +84,7 @@ class IVTApi:
         refresh_token: str | None = None,
         token_expires_at: datetime | None = None,
         on_token_refresh: callable = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
     ):
         """Initialize API client.
 
@@ -63,6 +96,7 @@ class IVTApi:
             token_expires_at: When the access token expires
             on_token_refresh: Callback(access_token, refresh_token, expires_at)
                               called after successful token refresh so HA can persist tokens
+            concurrency: Max number of GETs in flight at once
         """
         self._session = session
         self._device_id = device_id
@@ -70,8 +104,27 @@ class IVTApi:
         self._access_token = access_token
         self._refresh_token = refresh_token
         self._token_expires_at = token_expires_at
+        # Refresh deadline (expiry minus 5 minutes) as a plain epoch timestamp
+        self._token_expires_at_ts = (
+            token_expires_at.timestamp() - 300 if token_expires_at else None
+        )
         self._on_token_refresh = on_token_refresh
-        self._lock = asyncio.Lock()
+        self._update_headers()
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        # GETs run concurrently up to the limit. A PUT never overlaps reads or
+        # other writes (the K30 mishandles those): it stops new GETs from
+        # starting, waits for the in-flight ones, then runs on its own.
+        # Queued GETs wait behind it, so writes are not stuck behind a poll.
+        self._get_sem = asyncio.Semaphore(concurrency)
+        self._write_lock = asyncio.Lock()
+        self._no_write_pending = asyncio.Event()
+        self._no_write_pending.set()
+        self._reads_in_flight = 0
+        self._reads_idle = asyncio.Event()
+        self._reads_idle.set()
+        # path → (ETag, body) for conditional GETs
+        self._etag_cache: dict[str, tuple[str, dict]] = {}
 
     # ── Token Management ─────────────────────────────────────
 
@@ -89,11 +142,11 @@ class IVTApi:
 
     def _is_token_expired(self) -> bool:
         """Check if token is expired or expires within 5 minutes."""
-        if not self._token_expires_at:
+        if not self._access_token:
+            return True
+        if self._token_expires_at_ts is None:
             return bool(self._refresh_token)
-        return datetime.now(timezone.utc) >= (
-            self._token_expires_at - timedelta(minutes=5)
-        )
+        return time.time() >= self._token_expires_at_ts
 
     async def _refresh_access_token(self):
         """Refresh the access token using the refresh token."""
@@ -110,16 +163,23 @@ class IVTApi:
             async with self._session.post(TOKEN_URL, data=data) as resp:
                 if resp.status != 200:
                     text = await resp.text()
+                    if "invalid_grant" in text:
+                        # Refresh token was revoked or already rotated — retrying
+                        # with it would fail the same way, so drop both tokens
+                        self._access_token = None
+                        self._refresh_token = None
                     raise IVTAuthError(f"Token refresh failed ({resp.status}): {text}")
 
-                token_data = await resp.json()
+                token_data = orjson.loads(await resp.read())
                 self._access_token = token_data["access_token"]
+                self._update_headers()
                 if "refresh_token" in token_data:
                     self._refresh_token = token_data["refresh_token"]
                 expires_in = token_data.get("expires_in", 3600)
                 self._token_expires_at = datetime.now(timezone.utc) + timedelta(
                     seconds=expires_in
                 )
+                self._token_expires_at_ts = self._token_expires_at.timestamp() - 300
 
                 _LOGGER.info("Token refreshed (expires in %ds)", expires_in)
 
@@ -135,18 +195,32 @@ class IVTApi:
             raise IVTConnectionError(f"Token refresh connection error: {err}")
 
     async def _ensure_token(self):
-        """Ensure we have a valid token, refresh if needed."""
-        if self._is_token_expired():
-            await self._refresh_access_token()
+        """Ensure we have a valid token, refresh if needed.
+
+        Concurrent callers share a single in-flight refresh, so a rotated
+        refresh token is only ever posted to the token endpoint once.
+        """
+        if not self._is_token_expired():
+            return
+        async with self._refresh_lock:
+            if self._refresh_task is None or self._refresh_task.done():
+                # Another request may have refreshed while we waited for the lock
+                if not self._is_token_expired():
+                    return
+                self._refresh_task = asyncio.create_task(self._refresh_access_token())
+            task = self._refresh_task
+        await asyncio.shield(task)
 
     # ── HTTP Methods ─────────────────────────────────────────
 
     def _url(self, path: str) -> str:
         """Build full API URL from path."""
-        return f"{self._base_url}{path}"
+        return self._base_url + path
 
-    def _headers(self) -> dict:
-        return {"Authorization": f"Bearer {self._access_token}"}
+    def _update_headers(self):
+        """Rebuild the cached request headers after the access token changes."""
+        self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+        self._put_headers = {**self._auth_headers, "Content-Type": "application/json"}
 
     async def get(self, path: str) -> dict | None:
         """GET a value from the API.
@@ -155,26 +229,42 @@ class IVTApi:
             path: API path like "/heatingCircuits/hc1/roomtemperature"
 
         Returns:
-            Parsed JSON response dict, or None on error
+            Parsed JSON response dict, or None on error. When the server
+            answers 304 Not Modified, the previously returned dict is reused,
+            so callers must not mutate it.
         """
         await self._ensure_token()
         url = self._url(path)
 
+        cached = self._etag_cache.get(path)
+        if cached:
+            headers = {**self._auth_headers, "If-None-Match": cached[0]}
+        else:
+            headers = self._auth_headers
+
         try:
-            async with self._lock:
-                async with self._session.get(
-                    url, headers=self._headers(), timeout=30
-                ) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
-                    elif resp.status == 404:
-                        _LOGGER.debug("GET %s: not found", path)
-                        return None
+            async with self._get_sem, self._read(), self._session.get(
+                url, headers=headers, timeout=_TIMEOUT
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=orjson.loads)
+                    etag = resp.headers.get("ETag")
+                    if etag:
+                        self._etag_cache[path] = (etag, data)
                     else:
-                        text = await resp.text()
-                        _LOGGER.warning("GET %s: HTTP %d — %s", path, resp.status, text[:200])
-                        return None
-        except aiohttp.ClientError as err:
+                        self._etag_cache.pop(path, None)
+                    return data
+                elif resp.status == 304 and cached:
+                    return cached[1]
+                elif resp.status == 404:
+                    _LOGGER.debug("GET %s: not found", path)
+                    self._etag_cache.pop(path, None)
+                    return None
+                else:
+                    text = await resp.text()
+                    _LOGGER.warning("GET %s: HTTP %d — %s", path, resp.status, text[:200])
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("GET %s: connection error — %s", path, err)
             return None
 
@@ -190,27 +280,53 @@ class IVTApi:
         """
         await self._ensure_token()
         url = self._url(path)
-        payload = json.dumps({"value": value})
+        payload = orjson.dumps({"value": value})
 
         try:
-            async with self._lock:
-                async with self._session.put(
-                    url,
-                    data=payload,
-                    headers={**self._headers(), "Content-Type": "application/json"},
-                    timeout=30,
-                ) as resp:
-                    if resp.status in (200, 204):
-                        _LOGGER.info("PUT %s = %s: OK", path, value)
-                        return True
-                    else:
-                        text = await resp.text()
-                        _LOGGER.error("PUT %s = %s: HTTP %d — %s", path, value, resp.status, text[:200])
-                        return False
-        except aiohttp.ClientError as err:
+            async with self._exclusive(), self._session.put(
+                url,
+                data=payload,
+                headers=self._put_headers,
+                timeout=_TIMEOUT,
+            ) as resp:
+                if resp.status in (200, 204):
+                    _LOGGER.info("PUT %s = %s: OK", path, value)
+                    self._etag_cache.pop(path, None)
+                    return True
+                else:
+                    text = await resp.text()
+                    _LOGGER.error("PUT %s = %s: HTTP %d — %s", path, value, resp.status, text[:200])
+                    return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("PUT %s: connection error — %s", path, err)
             return False
 
+    @contextlib.asynccontextmanager
+    async def _read(self):
+        """Count a GET as in flight once no write is pending."""
+        while not self._no_write_pending.is_set():
+            await self._no_write_pending.wait()
+        self._reads_in_flight += 1
+        self._reads_idle.clear()
+        try:
+            yield
+        finally:
+            self._reads_in_flight -= 1
+            if not self._reads_in_flight:
+                self._reads_idle.set()
+
+    @contextlib.asynccontextmanager
+    async def _exclusive(self):
+        """Hold off new GETs and drain in-flight ones before a write."""
+        async with self._write_lock:
+            self._no_write_pending.clear()
+            try:
+                while self._reads_in_flight:
+                    await self._reads_idle.wait()
+                yield
+            finally:
+                self._no_write_pending.set()
+
     async def get_value(self, path: str):
         """GET and extract just the 'value' field. Returns None if unavailable."""
         data = await self.get(path)
@@ -218,15 +334,14 @@ class IVTApi:
             return data["value"]
         return None
 
-    async def get_many(self, paths: list[str]) -> dict:
+    async def get_many(self, paths: Sequence[str]) -> dict:
         """GET multiple paths and return {path: full_response_dict}.
 
-        Runs requests sequentially (K30 doesn't handle parallel well).
+        Runs requests concurrently; get() keeps at most `concurrency`
+        of them in flight against the K30.
         """
-        results = {}
-        for path in paths:
-            results[path] = await self.get(path)
-        return results
+        responses = await asyncio.gather(*(self.get(p) for p in paths))
+        return dict(zip(paths, responses))
 
     # ── Convenience Methods ──────────────────────────────────
 
@@ -261,12 +376,12 @@ class IVTApi:
     # ── OAuth Flow Helpers (for config_flow) ─────────────────
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def build_auth_url() -> str:
-        """Build the OAuth2 authorization URL for SingleKey ID."""
-        import hashlib
-        import base64
-        import urllib.parse
+        """Build the OAuth2 authorization URL for SingleKey ID.
 
+        Everything in the URL is a module constant, so it is built once and cached.
+        """
         challenge = hashlib.sha256(CODE_VERIFIER.encode()).digest()
         challenge_b64 = base64.urlsafe_b64encode(challenge).decode().rstrip("=")
 
@@ -293,13 +408,8 @@ class IVTApi:
     @staticmethod
     def extract_code_from_url(url: str) -> str | None:
         """Extract authorization code from OAuth callback URL."""
-        import urllib.parse
-
-        if "code=" in url:
-            parsed = urllib.parse.urlparse(url)
-            params = urllib.parse.parse_qs(parsed.query)
-            return params.get("code", [None])[0]
-        return None
+        params = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        return params.get("code", [None])[0]
 
     async def exchange_code_for_tokens(self, code: str) -> dict | None:
         """Exchange authorization code for tokens.
@@ -322,7 +432,7 @@ class IVTApi:
                     _LOGGER.error("Token exchange failed (%d): %s", resp.status, text[:300])
                     return None
 
-                token_data = await resp.json()
+                token_data = orjson.loads(await resp.read())
                 if "access_token" not in token_data:
                     _LOGGER.error("No access_token in response")
                     return None
@@ -8,12 +8,13 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, NOTIFICATIONS
+from .const import DOMAIN, NOTIFICATIONS
 from .coordinator import IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,39 +28,43 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
 
-    async_add_entities([IVTNotificationBinarySensor(coordinator, entry)])
+    async_add_entities(
+        [IVTNotificationBinarySensor(coordinator, entry, data["device_info"])]
+    )
 
 
-class IVTNotificationBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class IVTNotificationBinarySensor(IVTEntity, BinarySensorEntity):
     """Binary sensor that is ON when there are active notifications/errors."""
 
-    _attr_has_entity_name = True
     _attr_name = "Problem"
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:alert-circle"
+    _notifications: list = []  # Until the first successful _update_attrs
 
-    def __init__(self, coordinator: IVTDataCoordinator, entry: ConfigEntry):
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: IVTDataCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ):
+        super().__init__(coordinator, device_info)
         self._attr_unique_id = f"{entry.data['device_id']}_problem"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._refresh_attrs()
+
+    def _update_attrs(self) -> None:
+        """Read the notification list once per coordinator update."""
+        self._notifications = self.coordinator.get_values_list(NOTIFICATIONS) or []
 
     @property
     def is_on(self) -> bool:
         """True when there are active notifications."""
-        values = self.coordinator.get_values_list(NOTIFICATIONS)
-        return bool(values and len(values) > 0)
+        return bool(self._notifications)
 
     @property
     def extra_state_attributes(self) -> dict:
         """Notification details."""
-        values = self.coordinator.get_values_list(NOTIFICATIONS)
         return {
-            "notification_count": len(values) if values else 0,
-            "notifications": values or [],
+            "notification_count": len(self._notifications),
+            "notifications": self._notifications,
         }
@@ -5,11 +5,12 @@ import logging
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER, DHW_CHARGE
+from .const import DOMAIN, DHW_CHARGE
 from .coordinator import IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,25 +23,25 @@ async def async_setup_entry(
     """Set up button entities."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
+    device_info = data["device_info"]
 
     async_add_entities([
-        IVTChargeButton(coordinator, entry, "start"),
-        IVTChargeButton(coordinator, entry, "stop"),
+        IVTChargeButton(coordinator, entry, device_info, "start"),
+        IVTChargeButton(coordinator, entry, device_info, "stop"),
     ])
 
 
-class IVTChargeButton(CoordinatorEntity, ButtonEntity):
+class IVTChargeButton(IVTEntity, ButtonEntity):
     """Button to start/stop Extra Hot Water charge."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: IVTDataCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         action: str,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._action = action
         if action == "start":
             self._attr_name = "Start Extra Hot Water"
@@ -49,14 +50,9 @@ class IVTChargeButton(CoordinatorEntity, ButtonEntity):
             self._attr_name = "Stop Extra Hot Water"
             self._attr_icon = "mdi:water-boiler-off"
         self._attr_unique_id = f"{entry.data['device_id']}_btn_charge_{action}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
 
     async def async_press(self) -> None:
         """Handle button press."""
-        await self.coordinator.api.put(DHW_CHARGE, self._action)
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api.put(DHW_CHARGE, self._action):
+            self.coordinator.set_value(DHW_CHARGE, self._action)
+            self.coordinator.async_schedule_refresh()
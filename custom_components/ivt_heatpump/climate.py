@@ -8,6 +8,7 @@ Maps directly to the K30 API:
 """
 
 import logging
+from typing import Any
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -18,12 +19,11 @@ from homeassistant.components.climate import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    MANUFACTURER,
     HC_ROOM_TEMP,
     HC_CURRENT_SETPOINT,
     HC_TEMP_OVERRIDE,
@@ -40,6 +40,7 @@ from .const import (
     HC_MODE_AUTO,
 )
 from .coordinator import IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +48,26 @@ _LOGGER = logging.getLogger(__name__)
 PRESET_COMFORT = "comfort"
 PRESET_ECO = "eco"
 
+# Preset → schedule temperature level it applies
+PRESET_TO_LEVEL = {
+    PRESET_COMFORT: HC_COMFORT2_TEMP,
+    PRESET_ECO: HC_ECO_TEMP,
+}
+
+# Every path the climate entity reads, snapshotted once per coordinator update
+SNAPSHOT_PATHS = (
+    HC_ROOM_TEMP,
+    HC_CURRENT_SETPOINT,
+    HC_TEMP_OVERRIDE,
+    HC_OPERATION_MODE,
+    HC_ACTIVE_PROGRAM,
+    HC_STATUS,
+    HC_COMFORT2_TEMP,
+    HC_ECO_TEMP,
+    HC_HEAT_COOL_MODE,
+    HC_SUWI_MODE,
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -56,13 +77,12 @@ async def async_setup_entry(
     """Set up climate entity."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
-    async_add_entities([IVTClimate(coordinator, entry)])
+    async_add_entities([IVTClimate(coordinator, entry, data["device_info"])])
 
 
-class IVTClimate(CoordinatorEntity, ClimateEntity):
+class IVTClimate(IVTEntity, ClimateEntity):
     """Climate entity for IVT heating circuit (hc1)."""
 
-    _attr_has_entity_name = True
     _attr_name = "Heating"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_min_temp = HC_TEMP_MIN
@@ -75,24 +95,65 @@ class IVTClimate(CoordinatorEntity, ClimateEntity):
         | ClimateEntityFeature.PRESET_MODE
     )
 
-    def __init__(self, coordinator: IVTDataCoordinator, entry: ConfigEntry):
+    # Empty state until the first successful _update_attrs
+    _snapshot: dict[str, Any] = dict.fromkeys(SNAPSHOT_PATHS)
+    _target_temperature: float | None = None
+    _hvac_action: HVACAction | None = None
+    _preset_mode: str | None = None
+
+    def __init__(
+        self,
+        coordinator: IVTDataCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ):
         """Initialize."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._entry = entry
         self._attr_unique_id = f"{entry.data['device_id']}_climate_hc1"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._refresh_attrs()
+
+    def _update_attrs(self) -> None:
+        """Read all values this entity needs from the coordinator in one pass."""
+        get_value = self.coordinator.get_value
+        snap = {path: get_value(path) for path in SNAPSHOT_PATHS}
+        self._snapshot = snap
+
+        # In manual mode the override is the setpoint; in auto the schedule's
+        if snap[HC_OPERATION_MODE] == HC_MODE_MANUAL:
+            target = snap[HC_TEMP_OVERRIDE]
+        else:
+            target = snap[HC_CURRENT_SETPOINT]
+        self._target_temperature = target
+
+        # HVAC action from status, summer/winter mode and room vs target temp
+        room = snap[HC_ROOM_TEMP]
+        if snap[HC_STATUS] == "ch_disabled":
+            self._hvac_action = HVACAction.OFF
+        elif snap[HC_SUWI_MODE] == "cooling":
+            self._hvac_action = HVACAction.COOLING
+        elif room is not None and target is not None and room < target - 0.3:
+            self._hvac_action = HVACAction.HEATING
+        else:
+            self._hvac_action = HVACAction.IDLE
+
+        # Preset = whichever schedule level the current setpoint matches
+        setpoint = snap[HC_CURRENT_SETPOINT]
+        comfort2 = snap[HC_COMFORT2_TEMP]
+        eco = snap[HC_ECO_TEMP]
+        if setpoint is not None and comfort2 is not None and abs(setpoint - comfort2) < 0.3:
+            self._preset_mode = PRESET_COMFORT
+        elif setpoint is not None and eco is not None and abs(setpoint - eco) < 0.3:
+            self._preset_mode = PRESET_ECO
+        else:
+            self._preset_mode = None
 
     # ── State Properties ─────────────────────────────────────
 
     @property
     def current_temperature(self) -> float | None:
         """Current room temperature."""
-        return self.coordinator.get_value(HC_ROOM_TEMP)
+        return self._snapshot[HC_ROOM_TEMP]
 
     @property
     def target_temperature(self) -> float | None:
@@ -101,41 +162,19 @@ class IVTClimate(CoordinatorEntity, ClimateEntity):
         In manual mode: temporaryRoomSetpoint (user-set override)
         In auto mode: currentRoomSetpoint (schedule-determined)
         """
-        mode = self.coordinator.get_value(HC_OPERATION_MODE)
-        if mode == HC_MODE_MANUAL:
-            return self.coordinator.get_value(HC_TEMP_OVERRIDE)
-        return self.coordinator.get_value(HC_CURRENT_SETPOINT)
+        return self._target_temperature
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Current HVAC mode."""
-        mode = self.coordinator.get_value(HC_OPERATION_MODE)
-        if mode == HC_MODE_AUTO:
+        if self._snapshot[HC_OPERATION_MODE] == HC_MODE_AUTO:
             return HVACMode.AUTO
         return HVACMode.HEAT  # manual
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Current HVAC action based on status and heat demand."""
-        status = self.coordinator.get_value(HC_STATUS)
-        if status == "ch_disabled":
-            return HVACAction.OFF
-
-        heat_cool = self.coordinator.get_value(HC_HEAT_COOL_MODE)
-        suwi = self.coordinator.get_value(HC_SUWI_MODE)
-
-        if suwi == "cooling":
-            return HVACAction.COOLING
-
-        # Check if actively heating by comparing temps
-        current = self.current_temperature
-        target = self.target_temperature
-        if current is not None and target is not None:
-            if current < target - 0.3:
-                return HVACAction.HEATING
-            return HVACAction.IDLE
-
-        return HVACAction.IDLE
+        return self._hvac_action
 
     @property
     def preset_mode(self) -> str | None:
@@ -144,31 +183,22 @@ class IVTClimate(CoordinatorEntity, ClimateEntity):
         In auto mode, the schedule alternates between comfort2 and eco.
         We show which level is currently active based on target temp.
         """
-        current_setpoint = self.coordinator.get_value(HC_CURRENT_SETPOINT)
-        comfort2 = self.coordinator.get_value(HC_COMFORT2_TEMP)
-        eco = self.coordinator.get_value(HC_ECO_TEMP)
-
-        if current_setpoint is not None and comfort2 is not None:
-            if abs(current_setpoint - comfort2) < 0.3:
-                return PRESET_COMFORT
-        if current_setpoint is not None and eco is not None:
-            if abs(current_setpoint - eco) < 0.3:
-                return PRESET_ECO
-        return None
+        return self._preset_mode
 
     @property
     def extra_state_attributes(self) -> dict:
         """Extra attributes for diagnostics."""
+        snap = self._snapshot
         return {
-            "operation_mode_raw": self.coordinator.get_value(HC_OPERATION_MODE),
-            "active_program": self.coordinator.get_value(HC_ACTIVE_PROGRAM),
-            "comfort2_temp": self.coordinator.get_value(HC_COMFORT2_TEMP),
-            "eco_temp": self.coordinator.get_value(HC_ECO_TEMP),
-            "temporary_setpoint": self.coordinator.get_value(HC_TEMP_OVERRIDE),
-            "current_setpoint": self.coordinator.get_value(HC_CURRENT_SETPOINT),
-            "heat_cool_mode": self.coordinator.get_value(HC_HEAT_COOL_MODE),
-            "summer_winter_mode": self.coordinator.get_value(HC_SUWI_MODE),
-            "status": self.coordinator.get_value(HC_STATUS),
+            "operation_mode_raw": snap[HC_OPERATION_MODE],
+            "active_program": snap[HC_ACTIVE_PROGRAM],
+            "comfort2_temp": snap[HC_COMFORT2_TEMP],
+            "eco_temp": snap[HC_ECO_TEMP],
+            "temporary_setpoint": snap[HC_TEMP_OVERRIDE],
+            "current_setpoint": snap[HC_CURRENT_SETPOINT],
+            "heat_cool_mode": snap[HC_HEAT_COOL_MODE],
+            "summer_winter_mode": snap[HC_SUWI_MODE],
+            "status": snap[HC_STATUS],
         }
 
     # ── Commands ─────────────────────────────────────────────
@@ -176,10 +206,9 @@ class IVTClimate(CoordinatorEntity, ClimateEntity):
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode (manual/auto)."""
         if hvac_mode == HVACMode.AUTO:
-            await self.coordinator.api.put(HC_OPERATION_MODE, HC_MODE_AUTO)
+            await self._async_put(HC_OPERATION_MODE, HC_MODE_AUTO)
         elif hvac_mode == HVACMode.HEAT:
-            await self.coordinator.api.put(HC_OPERATION_MODE, HC_MODE_MANUAL)
-        await self.coordinator.async_request_refresh()
+            await self._async_put(HC_OPERATION_MODE, HC_MODE_MANUAL)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set target temperature.
@@ -190,21 +219,27 @@ class IVTClimate(CoordinatorEntity, ClimateEntity):
         """
         temp = kwargs.get(ATTR_TEMPERATURE)
         if temp is not None:
-            await self.coordinator.api.put(HC_TEMP_OVERRIDE, temp)
-            await self.coordinator.async_request_refresh()
+            await self._async_put(HC_TEMP_OVERRIDE, temp)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode.
 
         In auto mode, this sets the temperature override to the comfort2 or eco level.
         """
-        if preset_mode == PRESET_COMFORT:
-            temp = self.coordinator.get_value(HC_COMFORT2_TEMP)
-        elif preset_mode == PRESET_ECO:
-            temp = self.coordinator.get_value(HC_ECO_TEMP)
-        else:
+        level = PRESET_TO_LEVEL.get(preset_mode)
+        if level is None:
             return
 
+        temp = self._snapshot[level]
         if temp is not None:
-            await self.coordinator.api.put(HC_TEMP_OVERRIDE, temp)
-            await self.coordinator.async_request_refresh()
+            await self._async_put(HC_TEMP_OVERRIDE, temp)
+
+    async def _async_put(self, path: str, value) -> None:
+        """Write a value, show it right away and re-poll for derived state.
+
+        The K30 recalculates currentRoomSetpoint from the write, so a delayed
+        refresh picks that up once it has been applied.
+        """
+        if await self.coordinator.api.put(path, value):
+            self.coordinator.set_value(path, value)
+            self.coordinator.async_schedule_refresh()
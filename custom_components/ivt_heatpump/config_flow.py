@@ -17,6 +17,29 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Form schemas are static, so they are built once at import
+USER_SCHEMA = vol.Schema({
+    vol.Required("method", default="manual"): vol.In({
+        "manual": "Manual (paste tokens from tokens.json)",
+        "oauth": "OAuth Login (browser login flow)",
+    }),
+})
+
+MANUAL_SCHEMA = vol.Schema({
+    vol.Required(CONF_DEVICE_ID): str,
+    vol.Required(CONF_ACCESS_TOKEN): str,
+    vol.Optional(CONF_REFRESH_TOKEN): str,
+    vol.Optional(CONF_TOKEN_EXPIRES_AT): str,
+})
+
+OAUTH_START_SCHEMA = vol.Schema({
+    vol.Required(CONF_DEVICE_ID): str,
+})
+
+OAUTH_CALLBACK_SCHEMA = vol.Schema({
+    vol.Required("callback_url"): str,
+})
+
 
 class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle IVT Heat Pump config flow.
@@ -32,6 +55,15 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._device_id = None
         self._auth_url = None
 
+    def _create_api(self, device_id: str, access_token: str, refresh_token=None) -> IVTApi:
+        """Build an API client on HA's shared session so connections are pooled."""
+        return IVTApi(
+            session=async_get_clientsession(self.hass),
+            device_id=device_id,
+            access_token=access_token,
+            refresh_token=refresh_token,
+        )
+
     async def async_step_user(self, user_input=None):
         """Handle user initiated flow — choose setup method."""
         if user_input is not None:
@@ -43,12 +75,7 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required("method", default="manual"): vol.In({
-                    "manual": "Manual (paste tokens from tokens.json)",
-                    "oauth": "OAuth Login (browser login flow)",
-                }),
-            }),
+            data_schema=USER_SCHEMA,
         )
 
     # ── Manual Token Entry ───────────────────────────────────
@@ -64,13 +91,7 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             expires_at = user_input.get(CONF_TOKEN_EXPIRES_AT, "").strip()
 
             # Test connection
-            session = async_get_clientsession(self.hass)
-            api = IVTApi(
-                session=session,
-                device_id=device_id,
-                access_token=access_token,
-                refresh_token=refresh_token or None,
-            )
+            api = self._create_api(device_id, access_token, refresh_token or None)
 
             if await api.test_connection():
                 await self.async_set_unique_id(device_id)
@@ -90,12 +111,7 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema({
-                vol.Required(CONF_DEVICE_ID): str,
-                vol.Required(CONF_ACCESS_TOKEN): str,
-                vol.Optional(CONF_REFRESH_TOKEN): str,
-                vol.Optional(CONF_TOKEN_EXPIRES_AT): str,
-            }),
+            data_schema=MANUAL_SCHEMA,
             errors=errors,
             description_placeholders={
                 "tip": "Get these values from your tokens.json file"
@@ -115,9 +131,7 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="oauth_start",
-            data_schema=vol.Schema({
-                vol.Required(CONF_DEVICE_ID): str,
-            }),
+            data_schema=OAUTH_START_SCHEMA,
             errors=errors,
             description_placeholders={
                 "info": "Enter your device ID (from the IVT app or serial number)"
@@ -135,12 +149,7 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not code:
                 errors["base"] = "invalid_code"
             else:
-                session = async_get_clientsession(self.hass)
-                api = IVTApi(
-                    session=session,
-                    device_id=self._device_id,
-                    access_token="pending",
-                )
+                api = self._create_api(self._device_id, "pending")
 
                 tokens = await api.exchange_code_for_tokens(code)
                 if tokens:
@@ -161,9 +170,7 @@ class IVTHeatPumpConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="oauth_callback",
-            data_schema=vol.Schema({
-                vol.Required("callback_url"): str,
-            }),
+            data_schema=OAUTH_CALLBACK_SCHEMA,
             errors=errors,
             description_placeholders={
                 "auth_url": self._auth_url or IVTApi.build_auth_url(),
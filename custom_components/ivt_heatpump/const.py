@@ -25,6 +25,10 @@ SCOPES = [
 
 # Polling
 DEFAULT_SCAN_INTERVAL = 60  # seconds
+CONFIG_SCAN_INTERVAL = 3600  # seconds — static gateway/system info
+ENERGY_POLL_CYCLES = 5  # energy recordings are fetched every Nth realtime poll
+DEFAULT_CONCURRENCY = 4  # max parallel GETs per poll
+WRITE_REFRESH_DELAY = 5  # seconds for the K30 to reflect a write in its reads
 
 # ── Heating Circuit (HC) ────────────────────────────────────
 # API paths (relative to /heatingCircuits/hc1/)
@@ -80,6 +84,8 @@ DHW_TEMP_LIMITS = {
     DHW_MODE_LOW: {"min": 30.0, "max": 48.0},
     DHW_MODE_HIGH: {"min": 30.0, "max": 47.0},
 }
+DHW_MIN = {mode: limits["min"] for mode, limits in DHW_TEMP_LIMITS.items()}
+DHW_MAX = {mode: limits["max"] for mode, limits in DHW_TEMP_LIMITS.items()}
 
 # ── Heat Sources ─────────────────────────────────────────────
 HS_ACTUAL_MODULATION = "/heatSources/actualModulation"
@@ -145,3 +151,90 @@ VT_CH_MID_SETPOINT = "/system/variableTariff/ch/midPriceSetpoint"
 VT_DHW_OPTIMIZATION = "/system/variableTariff/dhw/optimization"
 VT_DHW_HIGH_ENABLE = "/system/variableTariff/dhw/highPriceEnable"
 VT_DHW_LOW_ENABLE = "/system/variableTariff/dhw/lowPriceEnable"
+
+# ── Poll Groups ──────────────────────────────────────────────
+# Paths polled every cycle (realtime data)
+REALTIME_PATHS = (
+    # Heating circuit
+    HC_ROOM_TEMP,
+    HC_CURRENT_SETPOINT,
+    HC_TEMP_OVERRIDE,
+    HC_OPERATION_MODE,
+    HC_ACTIVE_PROGRAM,
+    HC_STATUS,
+    HC_COMFORT2_TEMP,
+    HC_ECO_TEMP,
+    HC_MAX_FLOW_TEMP,
+    HC_HEAT_COOL_MODE,
+    HC_SUWI_MODE,
+    HC_SUWI_THRESHOLD,
+    # DHW
+    DHW_ACTUAL_TEMP,
+    DHW_CURRENT_SETPOINT,
+    DHW_OPERATION_MODE,
+    DHW_STATUS,
+    DHW_CHARGE,
+    DHW_CHARGE_DURATION,
+    DHW_SINGLE_CHARGE_SETPOINT,
+    DHW_TEMP_ECO,
+    DHW_TEMP_HIGH,
+    DHW_TEMP_LOW,
+    DHW_TD_MODE,
+    DHW_REDUCE_TEMP_ON_ALARM,
+    # Heat sources
+    HS_ACTUAL_MODULATION,
+    HS_SUPPLY_TEMP,
+    HS_RETURN_TEMP,
+    HS_CH_STATUS,
+    HS_HEAT_DEMAND,
+    HS_NUM_STARTS,
+    HS_STANDBY,
+    HS_EM_STATUS,
+    # System
+    SYS_OUTDOOR_TEMP,
+    # Heat source per-source
+    HS_HS1_STARTS,
+    # Notifications
+    NOTIFICATIONS,
+    # Variable Tariff
+    VT_CH_OPTIMIZATION,
+    VT_CH_HIGH_DELTA,
+    VT_CH_LOW_DELTA,
+    VT_CH_MID_SETPOINT,
+    VT_DHW_OPTIMIZATION,
+    VT_DHW_HIGH_ENABLE,
+    VT_DHW_LOW_ENABLE,
+)
+
+# Installation/gateway info that practically never changes (polled hourly)
+CONFIG_PATHS = (
+    HC_HEATING_TYPE,
+    HC_CONTROL_TYPE,
+    SYS_TYPE,
+    GW_FIRMWARE,
+    GW_HARDWARE,
+    GW_IP,
+    GW_MAC,
+    GW_SSID,
+    GW_SERIAL,
+    GW_SW_PREFIX,
+    GW_TIMEZONE,
+)
+
+# Energy recording paths (polled less frequently)
+ENERGY_PATHS = (
+    REC_TOTAL_COMPRESSOR,
+    REC_TOTAL_EHEATER,
+    REC_TOTAL_OUTPUT,
+    REC_CH_COMPRESSOR,
+    REC_CH_EHEATER,
+    REC_CH_OUTPUT,
+    REC_DHW_COMPRESSOR,
+    REC_DHW_EHEATER,
+    REC_DHW_OUTPUT,
+)
+
+
+def path_to_slug(path: str) -> str:
+    """Turn an API path into the slug used in entity unique IDs."""
+    return path.replace("/", "_").strip("_")
@@ -1,186 +1,72 @@
-"""Data update coordinator for IVT Heat Pump.
+"""Data update coordinators for IVT Heat Pump.
 
-Polls the K30 API at a regular interval and stores all data centrally.
+Polls the K30 API at regular intervals and stores all data centrally.
 All entities read from coordinator.data instead of making their own API calls.
+
+Two coordinators share the API client:
+  - IVTDataCoordinator: realtime values every minute (+ energy every 5th cycle)
+  - IVTConfigCoordinator: static gateway/system info once an hour
 """
 
 import logging
+from abc import ABC, abstractmethod
 from datetime import timedelta
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import IVTApi, IVTApiError, IVTAuthError
 from .const import (
+    CONFIG_PATHS,
+    CONFIG_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
-    # HC
-    HC_ROOM_TEMP,
-    HC_CURRENT_SETPOINT,
-    HC_TEMP_OVERRIDE,
-    HC_OPERATION_MODE,
-    HC_ACTIVE_PROGRAM,
-    HC_STATUS,
-    HC_COMFORT2_TEMP,
-    HC_ECO_TEMP,
-    HC_MAX_FLOW_TEMP,
-    HC_HEATING_TYPE,
-    HC_CONTROL_TYPE,
-    HC_HEAT_COOL_MODE,
-    HC_SUWI_MODE,
-    HC_SUWI_THRESHOLD,
-    # DHW
-    DHW_ACTUAL_TEMP,
-    DHW_CURRENT_SETPOINT,
-    DHW_OPERATION_MODE,
-    DHW_STATUS,
-    DHW_CHARGE,
-    DHW_CHARGE_DURATION,
-    DHW_SINGLE_CHARGE_SETPOINT,
-    DHW_TEMP_ECO,
-    DHW_TEMP_HIGH,
-    DHW_TEMP_LOW,
-    DHW_TD_MODE,
-    DHW_REDUCE_TEMP_ON_ALARM,
-    # Heat Sources
-    HS_ACTUAL_MODULATION,
-    HS_SUPPLY_TEMP,
-    HS_RETURN_TEMP,
-    HS_CH_STATUS,
-    HS_HEAT_DEMAND,
-    HS_NUM_STARTS,
-    HS_STANDBY,
-    HS_EM_STATUS,
-    # System
-    SYS_OUTDOOR_TEMP,
-    SYS_TYPE,
-    # Gateway
-    GW_FIRMWARE,
-    GW_HARDWARE,
-    GW_IP,
-    GW_MAC,
-    GW_SSID,
-    GW_SERIAL,
-    GW_SW_PREFIX,
-    GW_TIMEZONE,
-    # Heat source per-source starts
-    HS_HS1_STARTS,
-    # Notifications
-    NOTIFICATIONS,
-    # Variable Tariff
-    VT_CH_OPTIMIZATION,
-    VT_CH_HIGH_DELTA,
-    VT_CH_LOW_DELTA,
-    VT_CH_MID_SETPOINT,
-    VT_DHW_OPTIMIZATION,
-    VT_DHW_HIGH_ENABLE,
-    VT_DHW_LOW_ENABLE,
-    # Recordings (energy)
-    REC_TOTAL_COMPRESSOR,
-    REC_TOTAL_EHEATER,
-    REC_TOTAL_OUTPUT,
-    REC_CH_COMPRESSOR,
-    REC_CH_EHEATER,
-    REC_CH_OUTPUT,
-    REC_DHW_COMPRESSOR,
-    REC_DHW_EHEATER,
-    REC_DHW_OUTPUT,
+    ENERGY_PATHS,
+    ENERGY_POLL_CYCLES,
+    REALTIME_PATHS,
+    WRITE_REFRESH_DELAY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Paths polled every cycle (realtime data)
-POLL_PATHS = [
-    # Heating circuit
-    HC_ROOM_TEMP,
-    HC_CURRENT_SETPOINT,
-    HC_TEMP_OVERRIDE,
-    HC_OPERATION_MODE,
-    HC_ACTIVE_PROGRAM,
-    HC_STATUS,
-    HC_COMFORT2_TEMP,
-    HC_ECO_TEMP,
-    HC_MAX_FLOW_TEMP,
-    HC_HEAT_COOL_MODE,
-    HC_SUWI_MODE,
-    HC_SUWI_THRESHOLD,
-    HC_HEATING_TYPE,
-    HC_CONTROL_TYPE,
-    # DHW
-    DHW_ACTUAL_TEMP,
-    DHW_CURRENT_SETPOINT,
-    DHW_OPERATION_MODE,
-    DHW_STATUS,
-    DHW_CHARGE,
-    DHW_CHARGE_DURATION,
-    DHW_SINGLE_CHARGE_SETPOINT,
-    DHW_TEMP_ECO,
-    DHW_TEMP_HIGH,
-    DHW_TEMP_LOW,
-    DHW_TD_MODE,
-    DHW_REDUCE_TEMP_ON_ALARM,
-    # Heat sources
-    HS_ACTUAL_MODULATION,
-    HS_SUPPLY_TEMP,
-    HS_RETURN_TEMP,
-    HS_CH_STATUS,
-    HS_HEAT_DEMAND,
-    HS_NUM_STARTS,
-    HS_STANDBY,
-    HS_EM_STATUS,
-    # System
-    SYS_OUTDOOR_TEMP,
-    SYS_TYPE,
-    # Gateway
-    GW_FIRMWARE,
-    GW_HARDWARE,
-    GW_IP,
-    GW_MAC,
-    GW_SSID,
-    GW_SERIAL,
-    GW_SW_PREFIX,
-    GW_TIMEZONE,
-    # Heat source per-source
-    HS_HS1_STARTS,
-    # Notifications
-    NOTIFICATIONS,
-    # Variable Tariff
-    VT_CH_OPTIMIZATION,
-    VT_CH_HIGH_DELTA,
-    VT_CH_LOW_DELTA,
-    VT_CH_MID_SETPOINT,
-    VT_DHW_OPTIMIZATION,
-    VT_DHW_HIGH_ENABLE,
-    VT_DHW_LOW_ENABLE,
-]
-
-# Energy recording paths (polled less frequently)
-ENERGY_PATHS = [
-    REC_TOTAL_COMPRESSOR,
-    REC_TOTAL_EHEATER,
-    REC_TOTAL_OUTPUT,
-    REC_CH_COMPRESSOR,
-    REC_CH_EHEATER,
-    REC_CH_OUTPUT,
-    REC_DHW_COMPRESSOR,
-    REC_DHW_EHEATER,
-    REC_DHW_OUTPUT,
-]
-
-
-class IVTDataCoordinator(DataUpdateCoordinator):
-    """Coordinator to poll IVT heat pump data."""
+_CONFIG_PATH_SET = frozenset(CONFIG_PATHS)
 
-    def __init__(self, hass: HomeAssistant, api: IVTApi):
+# Raw values the K30 reports for a disconnected or invalid sensor
+_SENTINELS = frozenset((32767.0, -32768.0))
+
+
+class IVTCoordinator(DataUpdateCoordinator, ABC):
+    """Base coordinator: polls a group of paths and serves lookups on the result."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: IVTApi,
+        name: str,
+        update_interval: timedelta,
+    ):
         """Initialize coordinator."""
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            name=name,
+            update_interval=update_interval,
+            # Most values rarely change between polls; only notify entities
+            # when the fetched data differs from the previous poll
+            always_update=False,
         )
         self.api = api
-        self._energy_counter = 0  # Poll energy every 5th cycle
+        # path → 'value' field, path → cumulative total of recordings and
+        # (path, key) → value for emon-style values lists, rebuilt every poll
+        self._value_index: dict[str, Any] = {}
+        self._recording_index: dict[str, Any] = {}
+        self._emon_index: dict[tuple[str, str], Any] = {}
+
+    @abstractmethod
+    async def _async_poll(self) -> dict:
+        """Fetch this coordinator's paths."""
 
     async def _async_update_data(self) -> dict:
         """Fetch data from API.
@@ -189,37 +75,79 @@ class IVTDataCoordinator(DataUpdateCoordinator):
             dict mapping API path → response dict (with 'value', 'unitOfMeasure', etc.)
         """
         try:
-            data = await self.api.get_many(POLL_PATHS)
-
-            # Poll energy data every 5 minutes (every 5th cycle at 60s interval)
-            self._energy_counter += 1
-            if self._energy_counter >= 5:
-                self._energy_counter = 0
-                energy_data = await self.api.get_many(ENERGY_PATHS)
-                data.update(energy_data)
-            elif self.data:
-                # Carry forward previous energy data
-                for path in ENERGY_PATHS:
-                    if path in self.data:
-                        data[path] = self.data[path]
-
+            data = await self._async_poll()
+            self._value_index = self._build_value_index(data)
+            self._recording_index = self._build_recording_index(data)
+            self._emon_index = self._build_emon_index(data)
             return data
 
         except IVTAuthError as err:
-            raise UpdateFailed(f"Authentication error: {err}")
+            raise UpdateFailed(f"Authentication error: {err}") from err
         except IVTApiError as err:
-            raise UpdateFailed(f"API error: {err}")
-        except Exception as err:
-            raise UpdateFailed(f"Unexpected error: {err}")
+            raise UpdateFailed(f"API error: {err}") from err
 
-    def get_value(self, path: str):
-        """Get a value from the last poll. Returns None if unavailable."""
+    @callback
+    def set_value(self, path: str, value) -> None:
+        """Store a successfully written value and notify entities right away.
+
+        Saves a full re-poll after every write; the next scheduled poll
+        reconciles it with what the K30 reports. Entries are copied rather
+        than mutated since the API client may hand the same dicts out again.
+        """
         if not self.data:
-            return None
+            return
         entry = self.data.get(path)
-        if entry and isinstance(entry, dict):
-            return entry.get("value")
-        return None
+        new_entry = {**entry, "value": value} if isinstance(entry, dict) else {"value": value}
+        self._value_index[path] = value
+        self.async_set_updated_data({**self.data, path: new_entry})
+
+    @staticmethod
+    def _build_value_index(data: dict) -> dict[str, Any]:
+        """Map every path to its 'value' field, skipping entries without one.
+
+        Sentinel readings are stored as None so readers never see them.
+        """
+        index = {}
+        for path, entry in data.items():
+            if not isinstance(entry, dict) or "value" not in entry:
+                continue
+            value = entry["value"]
+            if isinstance(value, (int, float)) and value in _SENTINELS:
+                value = None
+            index[path] = value
+        return index
+
+    @staticmethod
+    def _build_recording_index(data: dict) -> dict[str, Any]:
+        """Map every recording path to the cumulative 'y' of its last entry."""
+        index = {}
+        for path, entry in data.items():
+            if not isinstance(entry, dict):
+                continue
+            recording = entry.get("recording")
+            if recording and isinstance(recording, list) and isinstance(recording[-1], dict):
+                index[path] = recording[-1].get("y")
+        return index
+
+    @staticmethod
+    def _build_emon_index(data: dict) -> dict[tuple[str, str], Any]:
+        """Flatten every values list into {(path, key): value}.
+
+        The first item holding a key wins, matching the old linear scan.
+        """
+        index = {}
+        for path, entry in data.items():
+            if not isinstance(entry, dict):
+                continue
+            for item in entry.get("values") or ():
+                if isinstance(item, dict):
+                    for key, value in item.items():
+                        index.setdefault((path, key), value)
+        return index
+
+    def get_value(self, path: str):
+        """Get a value from the last poll. Returns None if unavailable."""
+        return self._value_index.get(path)
 
     def get_entry(self, path: str) -> dict | None:
         """Get the full response dict for a path."""
@@ -237,15 +165,101 @@ class IVTDataCoordinator(DataUpdateCoordinator):
             return entry.get("values")
         return None
 
+    def get_recording_total(self, path: str) -> float | None:
+        """Get the cumulative total from a recordedValue response.
+
+        Recordings look like: {"recording": [{"c": 2.1, "d": "...", "y": 123.4}, ...]}
+        The last entry's 'y' is the running total.
+        """
+        return self._recording_index.get(path)
+
     def get_emon_value(self, path: str, key: str) -> float | None:
         """Get a specific value from an emon-style values list.
 
         E.g. /heatSources/hs1/numberOfStarts has:
           values: [{"ch": 4052}, {"dhw": 519}, {"cooling": 0}, {"total": 4571}]
         """
-        values = self.get_values_list(path)
-        if values:
-            for item in values:
-                if isinstance(item, dict) and key in item:
-                    return item[key]
-        return None
+        return self._emon_index.get((path, key))
+
+
+class IVTConfigCoordinator(IVTCoordinator):
+    """Coordinator for static installation/gateway info, polled hourly."""
+
+    def __init__(self, hass: HomeAssistant, api: IVTApi):
+        """Initialize coordinator."""
+        super().__init__(
+            hass, api, f"{DOMAIN}_config", timedelta(seconds=CONFIG_SCAN_INTERVAL)
+        )
+
+    async def _async_poll(self) -> dict:
+        return await self.api.get_many(CONFIG_PATHS)
+
+
+class IVTDataCoordinator(IVTCoordinator):
+    """Coordinator for realtime heat pump data.
+
+    Static paths are owned by the config coordinator; use for_path to get
+    the coordinator that polls a given path.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: IVTApi,
+        config_coordinator: IVTConfigCoordinator,
+    ):
+        """Initialize coordinator."""
+        super().__init__(
+            hass, api, DOMAIN, timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        )
+        self.config_coordinator = config_coordinator
+        self._cycle = 0  # Position in the energy polling schedule
+        self._unsub_delayed_refresh = None
+
+    def for_path(self, path: str) -> IVTCoordinator:
+        """Return the coordinator that polls a path (entities subscribe to it)."""
+        if path in _CONFIG_PATH_SET:
+            return self.config_coordinator
+        return self
+
+    @property
+    def next_is_energy(self) -> bool:
+        """True if the next scheduled poll will also fetch the energy paths."""
+        return self._cycle == ENERGY_POLL_CYCLES - 1
+
+    @callback
+    def async_schedule_refresh(self, delay: float = WRITE_REFRESH_DELAY) -> None:
+        """Refresh once the K30 has had time to apply a write.
+
+        Refreshing straight after a PUT reads back the old value. Writes made
+        within the delay push the refresh back so they share a single poll.
+        """
+        if self._unsub_delayed_refresh:
+            self._unsub_delayed_refresh()
+        self._unsub_delayed_refresh = async_call_later(
+            self.hass, delay, self._async_delayed_refresh
+        )
+
+    async def _async_delayed_refresh(self, _now) -> None:
+        self._unsub_delayed_refresh = None
+        await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending delayed refresh before shutting down."""
+        if self._unsub_delayed_refresh:
+            self._unsub_delayed_refresh()
+            self._unsub_delayed_refresh = None
+        await super().async_shutdown()
+
+    async def _async_poll(self) -> dict:
+        # Poll energy data every 5 minutes (every 5th cycle at 60s interval),
+        # batched into the same fan-out as the realtime paths
+        self._cycle = (self._cycle + 1) % ENERGY_POLL_CYCLES
+        if self._cycle == 0:
+            return await self.api.get_many(REALTIME_PATHS + ENERGY_PATHS)
+
+        data = await self.api.get_many(REALTIME_PATHS)
+        if prev := self.data:
+            # Carry forward previous energy data
+            data.update({p: prev[p] for p in ENERGY_PATHS if p in prev})
+        return data
@@ -0,0 +1,51 @@
+"""Base entity for IVT Heat Pump.
+
+All platforms share the entry's device info and refresh any cached state
+from the coordinator through the same error guard.
+"""
+
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import IVTCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IVTEntity(CoordinatorEntity):
+    """Coordinator entity for the IVT heat pump device.
+
+    Entities that cache state override _update_attrs and call
+    _refresh_attrs at the end of __init__, once their own fields are set.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: IVTCoordinator, device_info: DeviceInfo):
+        super().__init__(coordinator)
+        self._attr_device_info = device_info
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state before writing it."""
+        self._refresh_attrs()
+        super()._handle_coordinator_update()
+
+    def _refresh_attrs(self) -> None:
+        """Run _update_attrs, keeping the last good state if it raises.
+
+        One unexpected K30 value must neither abort platform setup nor stop
+        the coordinator from updating the remaining entities.
+        """
+        try:
+            self._update_attrs()
+        except Exception:
+            _LOGGER.exception(
+                "Error processing update for %s", self.entity_id or self.unique_id
+            )
+
+    def _update_attrs(self) -> None:
+        """Cache state from the coordinator. No-op for entities that read lazily."""
@@ -9,13 +9,12 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    MANUFACTURER,
     HC_COMFORT2_TEMP,
     HC_ECO_TEMP,
     HC_MAX_FLOW_TEMP,
@@ -28,13 +27,15 @@ from .const import (
     VT_CH_HIGH_DELTA,
     VT_CH_LOW_DELTA,
     VT_CH_MID_SETPOINT,
+    path_to_slug,
 )
 from .coordinator import IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 # (path, name, min, max, step, unit, icon, mode, category)
-NUMBER_ENTITIES = [
+NUMBER_ENTITIES = (
     # Heating levels
     (HC_COMFORT2_TEMP, "Heating Comfort Level", 20.5, 30.0, 0.5, UnitOfTemperature.CELSIUS, "mdi:sofa", NumberMode.SLIDER, None),
     (HC_ECO_TEMP, "Heating ECO Level", 5.0, 20.5, 0.5, UnitOfTemperature.CELSIUS, "mdi:leaf", NumberMode.SLIDER, None),
@@ -50,7 +51,24 @@ NUMBER_ENTITIES = [
     (VT_CH_HIGH_DELTA, "Tariff High Price Delta", 0.5, 2.0, 0.5, None, "mdi:cash-plus", NumberMode.SLIDER, "config"),
     (VT_CH_LOW_DELTA, "Tariff Low Price Delta", 0.0, 2.0, 0.5, None, "mdi:cash-minus", NumberMode.SLIDER, "config"),
     (VT_CH_MID_SETPOINT, "Tariff Mid Price Setpoint", 7.0, 28.0, 0.5, UnitOfTemperature.CELSIUS, "mdi:cash", NumberMode.SLIDER, "config"),
-]
+)
+
+# IVTNumber keyword arguments per entity, unpacked once at import
+NUMBER_SPECS = tuple(
+    {
+        "path": path,
+        "path_slug": path_to_slug(path),
+        "name": name,
+        "native_min": mn,
+        "native_max": mx,
+        "native_step": step,
+        "unit": unit,
+        "icon": icon,
+        "mode": mode,
+        "entity_category": cat,
+    }
+    for path, name, mn, mx, step, unit, icon, mode, cat in NUMBER_ENTITIES
+)
 
 
 async def async_setup_entry(
@@ -61,26 +79,23 @@ async def async_setup_entry(
     """Set up number entities."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
+    device_info = data["device_info"]
 
-    entities = []
-    for path, name, mn, mx, step, unit, icon, mode, cat in NUMBER_ENTITIES:
-        entities.append(
-            IVTNumber(coordinator, entry, path, name, mn, mx, step, unit, icon, mode, cat)
-        )
+    async_add_entities(
+        IVTNumber(coordinator, entry, device_info, **spec) for spec in NUMBER_SPECS
+    )
 
-    async_add_entities(entities)
 
-
-class IVTNumber(CoordinatorEntity, NumberEntity):
+class IVTNumber(IVTEntity, NumberEntity):
     """Writeable number entity backed by a K30 API endpoint."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: IVTDataCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         path: str,
+        path_slug: str,
         name: str,
         native_min: float,
         native_max: float,
@@ -90,7 +105,7 @@ class IVTNumber(CoordinatorEntity, NumberEntity):
         mode: NumberMode,
         entity_category: str | None,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._path = path
         self._attr_name = name
         self._attr_native_min_value = native_min
@@ -101,21 +116,14 @@ class IVTNumber(CoordinatorEntity, NumberEntity):
         self._attr_mode = mode
         if entity_category:
             self._attr_entity_category = EntityCategory(entity_category)
-        path_slug = path.replace("/", "_").strip("_")
         self._attr_unique_id = f"{entry.data['device_id']}_num_{path_slug}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._refresh_attrs()
 
-    @property
-    def native_value(self) -> float | None:
-        """Current value."""
-        return self.coordinator.get_value(self._path)
+    def _update_attrs(self) -> None:
+        """Read the current value once per coordinator update."""
+        self._attr_native_value = self.coordinator.get_value(self._path)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value via API."""
-        await self.coordinator.api.put(self._path, value)
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api.put(self._path, value):
+            self.coordinator.set_value(self._path, value)
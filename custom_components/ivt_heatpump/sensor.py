@@ -18,12 +18,12 @@ from homeassistant.const import (
     PERCENTAGE,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    MANUFACTURER,
     # HC
     HC_ROOM_TEMP,
     HC_CURRENT_SETPOINT,
@@ -73,6 +73,7 @@ from .const import (
     GW_TIMEZONE,
     # Notifications
     NOTIFICATIONS,
+    path_to_slug,
     # Energy recordings
     REC_TOTAL_COMPRESSOR,
     REC_TOTAL_EHEATER,
@@ -84,15 +85,19 @@ from .const import (
     REC_DHW_EHEATER,
     REC_DHW_OUTPUT,
 )
-from .coordinator import IVTDataCoordinator
+from .coordinator import IVTCoordinator, IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared attributes for the common no-notifications case (never mutated)
+_EMPTY_NOTIF_ATTRS = {"notifications": []}
+
 
 # ── Sensor Definitions ───────────────────────────────────────
 # (path, name, device_class, state_class, unit, icon, category)
 
-TEMPERATURE_SENSORS = [
+TEMPERATURE_SENSORS = (
     (SYS_OUTDOOR_TEMP, "Outdoor Temperature", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, UnitOfTemperature.CELSIUS, "mdi:thermometer", None),
     (HC_ROOM_TEMP, "Room Temperature", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, UnitOfTemperature.CELSIUS, "mdi:home-thermometer", None),
     (HC_CURRENT_SETPOINT, "Heating Target", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, UnitOfTemperature.CELSIUS, "mdi:thermostat", None),
@@ -109,9 +114,9 @@ TEMPERATURE_SENSORS = [
     (DHW_TEMP_HIGH, "DHW Comfort Level", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, UnitOfTemperature.CELSIUS, "mdi:fire", "diagnostic"),
     (DHW_SINGLE_CHARGE_SETPOINT, "Extra Hot Water Setpoint", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, UnitOfTemperature.CELSIUS, "mdi:water-boiler", "diagnostic"),
     (HC_SUWI_THRESHOLD, "Summer/Winter Threshold", SensorDeviceClass.TEMPERATURE, SensorStateClass.MEASUREMENT, UnitOfTemperature.CELSIUS, "mdi:sun-snowflake-variant", "diagnostic"),
-]
+)
 
-STATUS_SENSORS = [
+STATUS_SENSORS = (
     (HC_STATUS, "Heating Status", None, None, None, "mdi:radiator", None),
     (HC_HEAT_COOL_MODE, "Heat/Cool Mode", None, None, None, "mdi:sun-snowflake-variant", "diagnostic"),
     (HC_SUWI_MODE, "Summer/Winter Mode", None, None, None, "mdi:sun-snowflake-variant", None),
@@ -134,15 +139,15 @@ STATUS_SENSORS = [
     (GW_MAC, "Gateway MAC Address", None, None, None, "mdi:network-outline", "diagnostic"),
     (GW_SSID, "Gateway WiFi SSID", None, None, None, "mdi:wifi", "diagnostic"),
     (GW_TIMEZONE, "Gateway Timezone", None, None, None, "mdi:map-clock", "diagnostic"),
-]
+)
 
-NUMERIC_SENSORS = [
+NUMERIC_SENSORS = (
     (HS_ACTUAL_MODULATION, "Compressor Modulation", None, SensorStateClass.MEASUREMENT, PERCENTAGE, "mdi:gauge", None),
     (HS_NUM_STARTS, "Heat Pump Starts", None, SensorStateClass.TOTAL_INCREASING, None, "mdi:counter", "diagnostic"),
     (DHW_CHARGE_DURATION, "Charge Duration Setting", None, None, "min", "mdi:timer-outline", "diagnostic"),
-]
+)
 
-ENERGY_SENSORS = [
+ENERGY_SENSORS = (
     (REC_TOTAL_COMPRESSOR, "Total Compressor Energy", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, UnitOfEnergy.KILO_WATT_HOUR, "mdi:lightning-bolt", None),
     (REC_TOTAL_EHEATER, "Total E-Heater Energy", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, UnitOfEnergy.KILO_WATT_HOUR, "mdi:lightning-bolt", None),
     (REC_TOTAL_OUTPUT, "Total Heat Output", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, UnitOfEnergy.KILO_WATT_HOUR, "mdi:fire-circle", None),
@@ -152,7 +157,22 @@ ENERGY_SENSORS = [
     (REC_DHW_COMPRESSOR, "DHW Compressor Energy", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, UnitOfEnergy.KILO_WATT_HOUR, "mdi:lightning-bolt", "diagnostic"),
     (REC_DHW_EHEATER, "DHW E-Heater Energy", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, UnitOfEnergy.KILO_WATT_HOUR, "mdi:lightning-bolt", "diagnostic"),
     (REC_DHW_OUTPUT, "DHW Heat Output", SensorDeviceClass.ENERGY, SensorStateClass.TOTAL_INCREASING, UnitOfEnergy.KILO_WATT_HOUR, "mdi:fire-circle", "diagnostic"),
-]
+)
+
+# Per-source compressor starts (from hs1/numberOfStarts values list)
+# (path, key, name, device_class, state_class, unit, icon, category)
+EMON_SENSORS = (
+    (HS_HS1_STARTS, "ch", "CH Compressor Starts", None, SensorStateClass.TOTAL_INCREASING, None, "mdi:counter", "diagnostic"),
+    (HS_HS1_STARTS, "dhw", "DHW Compressor Starts", None, SensorStateClass.TOTAL_INCREASING, None, "mdi:counter", "diagnostic"),
+    (HS_HS1_STARTS, "cooling", "Cooling Compressor Starts", None, SensorStateClass.TOTAL_INCREASING, None, "mdi:counter", "diagnostic"),
+    (HS_HS1_STARTS, "total", "Total Compressor Starts", None, SensorStateClass.TOTAL_INCREASING, None, "mdi:counter", "diagnostic"),
+)
+
+# Unique ID slug per path, computed once at import
+_SLUGS = {
+    path: path_to_slug(path)
+    for path, *_ in TEMPERATURE_SENSORS + STATUS_SENSORS + NUMERIC_SENSORS + ENERGY_SENSORS + EMON_SENSORS
+}
 
 
 async def async_setup_entry(
@@ -163,47 +183,32 @@ async def async_setup_entry(
     """Set up sensor entities."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
-
-    entities = []
-
-    for path, name, dc, sc, unit, icon, cat in TEMPERATURE_SENSORS:
-        entities.append(IVTSensor(coordinator, entry, path, name, dc, sc, unit, icon, cat))
-
-    for path, name, dc, sc, unit, icon, cat in STATUS_SENSORS:
-        entities.append(IVTSensor(coordinator, entry, path, name, dc, sc, unit, icon, cat))
-
-    for path, name, dc, sc, unit, icon, cat in NUMERIC_SENSORS:
-        entities.append(IVTSensor(coordinator, entry, path, name, dc, sc, unit, icon, cat))
-
-    for path, name, dc, sc, unit, icon, cat in ENERGY_SENSORS:
-        entities.append(IVTEnergySensor(coordinator, entry, path, name, dc, sc, unit, icon, cat))
-
-    # Per-source compressor starts (from hs1/numberOfStarts values list)
-    for key, label in [("ch", "CH"), ("dhw", "DHW"), ("cooling", "Cooling"), ("total", "Total")]:
-        entities.append(
-            IVTEmonSensor(
-                coordinator, entry, HS_HS1_STARTS, key,
-                f"{label} Compressor Starts",
-                None, SensorStateClass.TOTAL_INCREASING, None,
-                "mdi:counter", "diagnostic",
-            )
-        )
-
-    # Notification count sensor
-    entities.append(IVTNotificationSensor(coordinator, entry))
-
-    async_add_entities(entities)
-
-
-class IVTSensor(CoordinatorEntity, SensorEntity):
+    device_info = data["device_info"]
+
+    async_add_entities(
+        [
+            *(
+                cls(coordinator.for_path(path), entry, device_info, path, *rest)
+                for cls, path, *rest in ALL_SENSORS
+            ),
+            *(
+                IVTEmonSensor(coordinator, entry, device_info, *spec)
+                for spec in EMON_SENSORS
+            ),
+            # Notification count sensor
+            IVTNotificationSensor(coordinator, entry, device_info),
+        ]
+    )
+
+
+class IVTSensor(IVTEntity, SensorEntity):
     """Generic sensor that reads a single API path from coordinator."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
-        coordinator: IVTDataCoordinator,
+        coordinator: IVTCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         path: str,
         name: str,
         device_class,
@@ -212,7 +217,7 @@ class IVTSensor(CoordinatorEntity, SensorEntity):
         icon: str,
         entity_category: str | None,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._path = path
         self._attr_name = name
         self._attr_device_class = device_class
@@ -220,39 +225,22 @@ class IVTSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         if entity_category:
-            from homeassistant.helpers.entity import EntityCategory
             self._attr_entity_category = EntityCategory(entity_category)
         # Unique ID from path
-        path_slug = path.replace("/", "_").strip("_")
-        self._attr_unique_id = f"{entry.data['device_id']}_{path_slug}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._attr_unique_id = f"{entry.data['device_id']}_{_SLUGS[path]}"
+        self._refresh_attrs()
 
-    @property
-    def native_value(self):
-        """Return sensor value."""
-        val = self.coordinator.get_value(self._path)
-        # Handle invalid float sentinel values
-        if isinstance(val, (int, float)):
-            if val in (32767.0, -32768.0):
-                return None
-        return val
+    def _update_attrs(self) -> None:
+        self._attr_native_value = self._read_value()
+
+    def _read_value(self):
+        """Read the raw value from the coordinator."""
+        return self.coordinator.get_value(self._path)
 
     @property
     def available(self) -> bool:
-        """Sensor is available if coordinator has data and value is not sentinel."""
-        if not super().available:
-            return False
-        val = self.coordinator.get_value(self._path)
-        if val is None:
-            return False
-        if isinstance(val, (int, float)) and val in (32767.0, -32768.0):
-            return False
-        return True
+        """Sensor is available if coordinator has data and holds a valid value."""
+        return super().available and self._attr_native_value is not None
 
 
 class IVTEnergySensor(IVTSensor):
@@ -269,38 +257,28 @@ class IVTEnergySensor(IVTSensor):
     The cumulative value 'y' from the last recording entry gives total kWh.
     """
 
-    @property
-    def native_value(self):
+    def _read_value(self):
         """Extract cumulative energy from recording data."""
-        entry = self.coordinator.get_entry(self._path)
-        if not entry:
-            return None
-
-        # Recording data format
-        recording = entry.get("recording")
-        if isinstance(recording, list) and len(recording) > 0:
-            # Last entry's 'y' value = cumulative total
-            last = recording[-1]
-            if isinstance(last, dict):
-                return last.get("y")
+        total = self.coordinator.get_recording_total(self._path)
+        if total is not None:
+            return total
 
         # Fallback: maybe it's a simple value
-        return entry.get("value")
+        return self.coordinator.get_value(self._path)
 
 
-class IVTEmonSensor(CoordinatorEntity, SensorEntity):
+class IVTEmonSensor(IVTEntity, SensorEntity):
     """Sensor that reads a specific key from an emon-style values list.
 
     E.g. /heatSources/hs1/numberOfStarts has:
       values: [{"ch": 4052}, {"dhw": 519}, {"cooling": 0}, {"total": 4571}]
     """
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: IVTDataCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         path: str,
         key: str,
         name: str,
@@ -310,7 +288,7 @@ class IVTEmonSensor(CoordinatorEntity, SensorEntity):
         icon: str,
         entity_category: str | None,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._path = path
         self._key = key
         self._attr_name = name
@@ -319,56 +297,48 @@ class IVTEmonSensor(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = unit
         self._attr_icon = icon
         if entity_category:
-            from homeassistant.helpers.entity import EntityCategory
             self._attr_entity_category = EntityCategory(entity_category)
-        path_slug = path.replace("/", "_").strip("_")
-        self._attr_unique_id = f"{entry.data['device_id']}_{path_slug}_{key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._attr_unique_id = f"{entry.data['device_id']}_{_SLUGS[path]}_{key}"
+        self._refresh_attrs()
 
-    @property
-    def native_value(self):
+    def _update_attrs(self) -> None:
         """Extract value for our key from the values list."""
-        return self.coordinator.get_emon_value(self._path, self._key)
+        self._attr_native_value = self.coordinator.get_emon_value(self._path, self._key)
 
 
-class IVTNotificationSensor(CoordinatorEntity, SensorEntity):
+class IVTNotificationSensor(IVTEntity, SensorEntity):
     """Sensor showing number of active notifications/errors.
 
     /notifications returns: {"type": "errorList", "values": [...]}
     """
 
-    _attr_has_entity_name = True
     _attr_name = "Active Notifications"
     _attr_icon = "mdi:bell-alert"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(self, coordinator: IVTDataCoordinator, entry: ConfigEntry):
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: IVTDataCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ):
+        super().__init__(coordinator, device_info)
         self._attr_unique_id = f"{entry.data['device_id']}_notifications_count"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._refresh_attrs()
 
-    @property
-    def native_value(self) -> int:
-        """Number of active notifications."""
-        values = self.coordinator.get_values_list(NOTIFICATIONS)
-        if values is None:
-            return 0
-        return len(values)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Include the notification details as attributes."""
+    def _update_attrs(self) -> None:
+        """Read the notification list once per coordinator update."""
         values = self.coordinator.get_values_list(NOTIFICATIONS)
         if values:
-            return {"notifications": values}
-        return {"notifications": []}
+            self._attr_native_value = len(values)
+            self._attr_extra_state_attributes = {"notifications": values}
+        else:
+            self._attr_native_value = 0
+            self._attr_extra_state_attributes = _EMPTY_NOTIF_ATTRS
+
+
+# Every single-path sensor with the entity class that reads it
+ALL_SENSORS = tuple(
+    [(IVTSensor, *t) for t in TEMPERATURE_SENSORS + STATUS_SENSORS + NUMERIC_SENSORS]
+    + [(IVTEnergySensor, *t) for t in ENERGY_SENSORS]
+)
@@ -5,31 +5,35 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    MANUFACTURER,
     DHW_REDUCE_TEMP_ON_ALARM,
     VT_CH_OPTIMIZATION,
     VT_DHW_OPTIMIZATION,
     VT_DHW_HIGH_ENABLE,
     VT_DHW_LOW_ENABLE,
+    path_to_slug,
 )
 from .coordinator import IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 # (path, name, on_value, off_value, icon, category)
-SWITCH_ENTITIES = [
+SWITCH_ENTITIES = (
     (DHW_REDUCE_TEMP_ON_ALARM, "Reduce DHW Temp on Alarm", "on", "off", "mdi:alert-outline", "config"),
     (VT_CH_OPTIMIZATION, "Tariff CH Optimization", "on", "off", "mdi:cash-fast", "config"),
     (VT_DHW_OPTIMIZATION, "Tariff DHW Optimization", "on", "off", "mdi:cash-fast", "config"),
     (VT_DHW_HIGH_ENABLE, "Tariff DHW High Price", "yes", "no", "mdi:cash-plus", "config"),
     (VT_DHW_LOW_ENABLE, "Tariff DHW Low Price", "yes", "no", "mdi:cash-minus", "config"),
-]
+)
+
+# Unique ID slug per path, computed once at import
+_SLUGS = {path: path_to_slug(path) for path, *_ in SWITCH_ENTITIES}
 
 
 async def async_setup_entry(
@@ -40,23 +44,21 @@ async def async_setup_entry(
     """Set up switch entities."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
+    device_info = data["device_info"]
 
-    entities = []
-    for path, name, on_val, off_val, icon, cat in SWITCH_ENTITIES:
-        entities.append(IVTSwitch(coordinator, entry, path, name, on_val, off_val, icon, cat))
+    async_add_entities(
+        [IVTSwitch(coordinator, entry, device_info, *spec) for spec in SWITCH_ENTITIES]
+    )
 
-    async_add_entities(entities)
 
-
-class IVTSwitch(CoordinatorEntity, SwitchEntity):
+class IVTSwitch(IVTEntity, SwitchEntity):
     """Toggle switch backed by a K30 string value (on/off or yes/no)."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: IVTDataCoordinator,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         path: str,
         name: str,
         on_value: str,
@@ -64,7 +66,7 @@ class IVTSwitch(CoordinatorEntity, SwitchEntity):
         icon: str,
         entity_category: str | None,
     ):
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._path = path
         self._on_value = on_value
         self._off_value = off_value
@@ -72,14 +74,7 @@ class IVTSwitch(CoordinatorEntity, SwitchEntity):
         self._attr_icon = icon
         if entity_category:
             self._attr_entity_category = EntityCategory(entity_category)
-        path_slug = path.replace("/", "_").strip("_")
-        self._attr_unique_id = f"{entry.data['device_id']}_sw_{path_slug}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
+        self._attr_unique_id = f"{entry.data['device_id']}_sw_{_SLUGS[path]}"
 
     @property
     def is_on(self) -> bool | None:
@@ -91,10 +86,10 @@ class IVTSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on."""
-        await self.coordinator.api.put(self._path, self._on_value)
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api.put(self._path, self._on_value):
+            self.coordinator.set_value(self._path, self._on_value)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off."""
-        await self.coordinator.api.put(self._path, self._off_value)
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api.put(self._path, self._off_value):
+            self.coordinator.set_value(self._path, self._off_value)
@@ -15,12 +15,11 @@ from homeassistant.components.water_heater import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    MANUFACTURER,
     DHW_ACTUAL_TEMP,
     DHW_CURRENT_SETPOINT,
     DHW_OPERATION_MODE,
@@ -37,9 +36,11 @@ from .const import (
     DHW_MODE_ECO,
     DHW_MODE_HIGH,
     DHW_MODE_AUTO,
-    DHW_TEMP_LIMITS,
+    DHW_MIN,
+    DHW_MAX,
 )
 from .coordinator import IVTDataCoordinator
+from .entity import IVTEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,13 +77,12 @@ async def async_setup_entry(
     """Set up water heater entity."""
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator = data["coordinator"]
-    async_add_entities([IVTWaterHeater(coordinator, entry)])
+    async_add_entities([IVTWaterHeater(coordinator, entry, data["device_info"])])
 
 
-class IVTWaterHeater(CoordinatorEntity, WaterHeaterEntity):
+class IVTWaterHeater(IVTEntity, WaterHeaterEntity):
     """Water heater entity for IVT DHW circuit."""
 
-    _attr_has_entity_name = True
     _attr_name = "Hot Water"
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_operation_list = [
@@ -98,88 +98,61 @@ class IVTWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         | WaterHeaterEntityFeature.AWAY_MODE
     )
 
-    def __init__(self, coordinator: IVTDataCoordinator, entry: ConfigEntry):
+    # Unknown mode until the first successful _update_attrs
+    _bosch_mode: str | None = None
+    _temp_path: str | None = None
+
+    def __init__(
+        self,
+        coordinator: IVTDataCoordinator,
+        entry: ConfigEntry,
+        device_info: DeviceInfo,
+    ):
         """Initialize."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_info)
         self._entry = entry
         self._attr_unique_id = f"{entry.data['device_id']}_water_heater_dhw1"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.data["device_id"])},
-            "name": "IVT Heat Pump",
-            "manufacturer": MANUFACTURER,
-            "model": "K30",
-        }
-
-    # ── State Properties ─────────────────────────────────────
-
-    @property
-    def current_temperature(self) -> float | None:
-        """Current water temperature."""
-        return self.coordinator.get_value(DHW_ACTUAL_TEMP)
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Target temperature for current mode.
-
-        Each mode has its own target from temperatureLevels/.
-        In auto mode, we show currentSetpoint.
-        """
-        bosch_mode = self.coordinator.get_value(DHW_OPERATION_MODE)
-        if bosch_mode in MODE_TO_TEMP_PATH:
-            return self.coordinator.get_value(MODE_TO_TEMP_PATH[bosch_mode])
+        self._refresh_attrs()
+
+    def _update_attrs(self) -> None:
+        """Derive the whole entity state from one read of the operation mode."""
+        get_value = self.coordinator.get_value
+        bosch_mode = get_value(DHW_OPERATION_MODE)
+        charge_active = get_value(DHW_CHARGE) == "start"
+        self._bosch_mode = bosch_mode
+        self._temp_path = MODE_TO_TEMP_PATH.get(bosch_mode)
+
+        self._attr_current_temperature = get_value(DHW_ACTUAL_TEMP)
+        # Each mode has its own target from temperatureLevels/.
         # For auto/off, show the currentSetpoint (read-only)
-        return self.coordinator.get_value(DHW_CURRENT_SETPOINT)
-
-    @property
-    def min_temp(self) -> float:
-        """Min temperature for current mode."""
-        bosch_mode = self.coordinator.get_value(DHW_OPERATION_MODE)
-        limits = DHW_TEMP_LIMITS.get(bosch_mode)
-        return limits["min"] if limits else 30.0
-
-    @property
-    def max_temp(self) -> float:
-        """Max temperature for current mode."""
-        bosch_mode = self.coordinator.get_value(DHW_OPERATION_MODE)
-        limits = DHW_TEMP_LIMITS.get(bosch_mode)
-        return limits["max"] if limits else 70.0
-
-    @property
-    def current_operation(self) -> str | None:
-        """Current operation mode (HA name)."""
-        bosch_mode = self.coordinator.get_value(DHW_OPERATION_MODE)
-        return BOSCH_TO_HA.get(bosch_mode, bosch_mode)
-
-    @property
-    def is_away_mode_on(self) -> bool:
-        """Away mode = Extra Hot Water (charge active)."""
-        return self.coordinator.get_value(DHW_CHARGE) == "start"
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Extra attributes."""
-        return {
-            "operation_mode_raw": self.coordinator.get_value(DHW_OPERATION_MODE),
-            "current_setpoint": self.coordinator.get_value(DHW_CURRENT_SETPOINT),
-            "charge_active": self.coordinator.get_value(DHW_CHARGE) == "start",
-            "charge_duration_mins": self.coordinator.get_value(DHW_CHARGE_DURATION),
-            "charge_setpoint": self.coordinator.get_value(DHW_SINGLE_CHARGE_SETPOINT),
-            "status": self.coordinator.get_value(DHW_STATUS),
-            "eco_temp": self.coordinator.get_value(DHW_TEMP_ECO),
-            "eco_plus_temp": self.coordinator.get_value(DHW_TEMP_LOW),
-            "comfort_temp": self.coordinator.get_value(DHW_TEMP_HIGH),
+        self._attr_target_temperature = get_value(self._temp_path or DHW_CURRENT_SETPOINT)
+        self._attr_min_temp = DHW_MIN.get(bosch_mode, 30.0)
+        self._attr_max_temp = DHW_MAX.get(bosch_mode, 70.0)
+        self._attr_current_operation = BOSCH_TO_HA.get(bosch_mode, bosch_mode)
+        # Away mode = Extra Hot Water (charge active)
+        self._attr_is_away_mode_on = charge_active
+        self._attr_extra_state_attributes = {
+            "operation_mode_raw": bosch_mode,
+            "current_setpoint": get_value(DHW_CURRENT_SETPOINT),
+            "charge_active": charge_active,
+            "charge_duration_mins": get_value(DHW_CHARGE_DURATION),
+            "charge_setpoint": get_value(DHW_SINGLE_CHARGE_SETPOINT),
+            "status": get_value(DHW_STATUS),
+            "eco_temp": get_value(DHW_TEMP_ECO),
+            "eco_plus_temp": get_value(DHW_TEMP_LOW),
+            "comfort_temp": get_value(DHW_TEMP_HIGH),
         }
 
     # ── Commands ─────────────────────────────────────────────
 
     async def async_set_operation_mode(self, operation_mode: str) -> None:
         """Set DHW operation mode."""
-        bosch_mode = HA_TO_BOSCH.get(operation_mode)
-        if bosch_mode:
-            await self.coordinator.api.put(DHW_OPERATION_MODE, bosch_mode)
-            await self.coordinator.async_request_refresh()
-        else:
+        if operation_mode not in HA_TO_BOSCH:
             _LOGGER.warning("Unknown DHW mode: %s", operation_mode)
+            return
+        bosch_mode = HA_TO_BOSCH[operation_mode]
+        if await self.coordinator.api.put(DHW_OPERATION_MODE, bosch_mode):
+            self.coordinator.set_value(DHW_OPERATION_MODE, bosch_mode)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set target temperature for the current mode.
@@ -190,24 +163,23 @@ class IVTWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         if temp is None:
             return
 
-        bosch_mode = self.coordinator.get_value(DHW_OPERATION_MODE)
-        temp_path = MODE_TO_TEMP_PATH.get(bosch_mode)
+        temp_path = self._temp_path
 
         if temp_path:
-            await self.coordinator.api.put(temp_path, temp)
-            await self.coordinator.async_request_refresh()
+            if await self.coordinator.api.put(temp_path, temp):
+                self.coordinator.set_value(temp_path, temp)
         else:
             _LOGGER.warning(
                 "Cannot set temperature in mode %s (no writeable setpoint)",
-                bosch_mode,
+                self._bosch_mode,
             )
 
     async def async_turn_away_mode_on(self) -> None:
         """Start Extra Hot Water charge."""
-        await self.coordinator.api.put(DHW_CHARGE, "start")
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api.put(DHW_CHARGE, "start"):
+            self.coordinator.set_value(DHW_CHARGE, "start")
 
     async def async_turn_away_mode_off(self) -> None:
         """Stop Extra Hot Water charge."""
-        await self.coordinator.api.put(DHW_CHARGE, "stop")
-        await self.coordinator.async_request_refresh()
+        if await self.coordinator.api.put(DHW_CHARGE, "stop"):
+            self.coordinator.set_value(DHW_CHARGE, "stop")